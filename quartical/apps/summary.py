@@ -273,6 +273,17 @@ def dimension_summary(xds_list):
     logger.info(msg)
 
 
+def _count_flags(flag_col, flag_row_col):
+    """Count flagged elements in a block, treating FLAG_ROW as a full flag."""
+
+    _, n_chan, n_corr = flag_col.shape
+
+    n_flag_per_row = np.count_nonzero(flag_col, axis=(1, 2))
+    n_flag_per_row[flag_row_col] = n_chan * n_corr
+
+    return np.array(n_flag_per_row.sum(), ndmin=2)
+
+
 def flagging_summary(xds_list):
 
     n_flag_per_xds = []
@@ -281,10 +292,19 @@ def flagging_summary(xds_list):
 
     for xds in xds_list:
 
-        flags = xds.FLAG.data | xds.FLAG_ROW.data[:, None, None]
-
-        n_flag = da.sum(flags)
-        n_elem = flags.size
+        # Count per block rather than broadcasting FLAG_ROW against FLAG,
+        # which would materialise a temporary the size of the data.
+        n_flag_per_block = da.blockwise(
+            _count_flags, ("row", "chan"),
+            xds.FLAG.data, ("row", "chan", "corr"),
+            xds.FLAG_ROW.data, ("row",),
+            adjust_chunks={"row": 1, "chan": 1},
+            concatenate=True,
+            dtype=np.int64
+        )
+
+        n_flag = da.sum(n_flag_per_block)
+        n_elem = xds.FLAG.data.size
         flag_perc = (n_flag/n_elem)*100
 
         n_flag_per_xds.append(n_flag)
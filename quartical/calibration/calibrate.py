@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
+from operator import getitem
 import numpy as np
 import dask.array as da
+from numba import set_num_threads
 from quartical.calibration.mapping import make_mapping_datasets
 from quartical.gains.general.generics import (compute_residual,
                                               compute_corrected_residual,
@@ -24,10 +26,13 @@ def dask_residual(
     row_map,
     row_weights,
     corr_mode,
+    threads,
     *args
 ):
     """Thin wrapper to handle an unknown number of input gains."""
 
+    set_num_threads(threads)  # Set numba threads.
+
     gains = tuple(args[::4])
     time_maps = tuple(args[1::4])
     freq_maps = tuple(args[2::4])
@@ -49,6 +54,51 @@ def dask_residual(
     )
 
 
+def dask_both_residuals(
+    data,
+    model,
+    a1,
+    a2,
+    sub_dirs,
+    row_map,
+    row_weights,
+    corr_mode,
+    threads,
+    *args
+):
+    """Produces both the residual and corrected residual in a single task.
+
+    Avoids traversing the data, model and gains twice when both outputs are
+    required.
+    """
+
+    residual = dask_residual(
+        data,
+        model,
+        a1,
+        a2,
+        sub_dirs,
+        row_map,
+        row_weights,
+        corr_mode,
+        threads,
+        *args
+    )
+
+    corrected_residual = dask_corrected_residual(
+        residual,
+        a1,
+        a2,
+        row_map,
+        row_weights,
+        corr_mode,
+        threads,
+        *args
+    )
+
+    return residual, corrected_residual
+
+
 def dask_corrected_residual(
     residual,
     a1,
@@ -56,10 +106,13 @@ def dask_corrected_residual(
     row_map,
     row_weights,
     corr_mode,
+    threads,
     *args
 ):
     """Thin wrapper to handle an unknown number of input gains."""
 
+    set_num_threads(threads)  # Set numba threads.
+
     gains = tuple(args[::4])
     time_maps = tuple(args[1::4])
     freq_maps = tuple(args[2::4])
@@ -205,6 +258,7 @@ def add_calibration_graph(
         data_xds_list,
         gain_xds_lod,
         mapping_xds_list,
+        solver_opts,
         output_opts
     )
 
@@ -228,6 +282,7 @@ def make_visibility_output(
     data_xds_list,
     solved_gain_xds_lod,
     mapping_xds_list,
+    solver_opts,
     output_opts
 ):
     """Creates dask arrays for possible visibility outputs.
@@ -265,6 +320,9 @@ def make_visibility_output(
                 f"in the model: {invalid}."
             )
 
+    # The gain schema is common to all datasets and gain terms.
+    gain_schema = ("rowlike", "chan", "ant", "dir", "corr")
+
     for xds_ind, (data_xds, mapping_xds) in itr:
         data_col = data_xds.DATA.data
         model_col = data_xds.MODEL_DATA.data
@@ -285,11 +343,15 @@ def make_visibility_output(
 
         corr_mode = data_xds.sizes["corr"]
 
-        is_bda = hasattr(data_xds, "ROW_MAP")  # We are dealing with BDA.
-        row_map = data_xds.ROW_MAP.data if is_bda else None
-        row_weights = data_xds.ROW_WEIGHTS.data if is_bda else None
-
-        gain_schema = ("rowlike", "chan", "ant", "dir", "corr")
+        # The BDA inputs are shared by all of the outputs below. In the
+        # non-BDA case these are None placeholders for the kernels.
+        if hasattr(data_xds, "ROW_MAP"):  # We are dealing with BDA.
+            bda_args = (
+                data_xds.ROW_MAP.data, ("rowlike",),
+                data_xds.ROW_WEIGHTS.data, ("rowlike",)
+            )
+        else:
+            bda_args = (None, None, None, None)
 
         term_args = []
 
@@ -299,37 +361,65 @@ def make_visibility_output(
             term_args.extend([freq_maps[gain_idx], ("chan",)])
             term_args.extend([dir_maps[gain_idx], ("dir",)])
 
-        residual = da.blockwise(
-            dask_residual, ("rowlike", "chan", "corr"),
+        residual_args = (
             data_col, ("rowlike", "chan", "corr"),
             model_col, ("rowlike", "chan", "dir", "corr"),
             ant1_col, ("rowlike",),
             ant2_col, ("rowlike",),
             output_opts.subtract_directions, None,
-            *((row_map, ("rowlike",)) if is_bda else (None, None)),
-            *((row_weights, ("rowlike",)) if is_bda else (None, None)),
+            *bda_args,
             corr_mode, None,
-            *term_args,
-            meta=np.empty((0, 0, 0), dtype=data_col.dtype),
-            align_arrays=False,
-            concatenate=True,
-            adjust_chunks={"rowlike": data_col.chunks[0],
-                           "chan": data_col.chunks[1]})
+            solver_opts.threads, None,
+            *term_args
+        )
 
-        corrected_residual = da.blockwise(
-            dask_corrected_residual, ("rowlike", "chan", "corr"),
-            residual, ("rowlike", "chan", "corr"),
-            ant1_col, ("rowlike",),
-            ant2_col, ("rowlike",),
-            *((row_map, ("rowlike",)) if is_bda else (None, None)),
-            *((row_weights, ("rowlike",)) if is_bda else (None, None)),
-            corr_mode, None,
-            *term_args,
-            meta=np.empty((0, 0, 0), dtype=residual.dtype),
-            align_arrays=False,
-            concatenate=True,
-            adjust_chunks={"rowlike": data_col.chunks[0],
-                           "chan": data_col.chunks[1]})
+        if "corrected_residual" in (output_opts.products or ()):
+            # Both outputs are definitely required - produce them in a single
+            # task per chunk. Each block of this array holds a tuple of both.
+            residual_tuple = da.blockwise(
+                dask_both_residuals, ("rowlike", "chan", "corr"),
+                *residual_args,
+                meta=np.empty((0, 0, 0), dtype=object),
+                align_arrays=False,
+                concatenate=True,
+                adjust_chunks={"rowlike": data_col.chunks[0],
+                               "chan": data_col.chunks[1]})
+
+            residual, corrected_residual = [
+                da.blockwise(
+                    getitem, ("rowlike", "chan", "corr"),
+                    residual_tuple, ("rowlike", "chan", "corr"),
+                    idx, None,
+                    meta=np.empty((0, 0, 0), dtype=data_col.dtype)
+                )
+                for idx in range(2)
+            ]
+        else:
+            # Keep the corrected residual in its own layer so that it can be
+            # culled when only the residual is used e.g. by MAD flagging.
+            residual = da.blockwise(
+                dask_residual, ("rowlike", "chan", "corr"),
+                *residual_args,
+                meta=np.empty((0, 0, 0), dtype=data_col.dtype),
+                align_arrays=False,
+                concatenate=True,
+                adjust_chunks={"rowlike": data_col.chunks[0],
+                               "chan": data_col.chunks[1]})
+
+            corrected_residual = da.blockwise(
+                dask_corrected_residual, ("rowlike", "chan", "corr"),
+                residual, ("rowlike", "chan", "corr"),
+                ant1_col, ("rowlike",),
+                ant2_col, ("rowlike",),
+                *bda_args,
+                corr_mode, None,
+                solver_opts.threads, None,
+                *term_args,
+                meta=np.empty((0, 0, 0), dtype=residual.dtype),
+                align_arrays=False,
+                concatenate=True,
+                adjust_chunks={"rowlike": data_col.chunks[0],
+                               "chan": data_col.chunks[1]})
 
         # We can cheat and reuse the corrected residual code - the only
         # difference is whether we supply the residuals or the data.
@@ -338,9 +428,9 @@ def make_visibility_output(
             data_col, ("rowlike", "chan", "corr"),
             ant1_col, ("rowlike",),
             ant2_col, ("rowlike",),
-            *((row_map, ("rowlike",)) if is_bda else (None, None)),
-            *((row_weights, ("rowlike",)) if is_bda else (None, None)),
+            *bda_args,
             corr_mode, None,
+            solver_opts.threads, None,
             *term_args,
             meta=np.empty((0, 0, 0), dtype=data_col.dtype),
             align_arrays=False,
@@ -355,8 +445,7 @@ def make_visibility_output(
             weight_col, ("rowlike", "chan", "corr"),
             ant1_col, ("rowlike",),
             ant2_col, ("rowlike",),
-            *((row_map, ("rowlike",)) if is_bda else (None, None)),
-            *((row_weights, ("rowlike",)) if is_bda else (None, None)),
+            *bda_args,
             corr_mode, None,
             *term_args,
             meta=np.empty((0, 0, 0), dtype=weight_col.dtype),
@@ -366,6 +455,16 @@ def make_visibility_output(
                            "chan": data_col.chunks[1]}
         )
 
+        # The direction axis is never chunked so we can sum over it blockwise,
+        # avoiding the overheads of a tree reduction.
+        model_sum = da.blockwise(
+            np.sum, ("rowlike", "chan", "corr"),
+            model_col, ("rowlike", "chan", "dir", "corr"),
+            axis=2,
+            dtype=model_col.dtype,
+            concatenate=True
+        )
+
         # QuartiCal will assign these to the xarray.Datasets as the following
         # underscore prefixed data vars. This is done to avoid overwriting
         # input data prematurely.
@@ -374,6 +473,7 @@ def make_visibility_output(
             "_CORRECTED_RESIDUAL": corrected_residual,
             "_CORRECTED_DATA": corrected_data,
             "_CORRECTED_WEIGHT": corrected_weight,
+            "_MODEL_DATA": model_sum,
         }
 
         dims = data_xds.DATA.dims  # All visiblity columns share these dims.
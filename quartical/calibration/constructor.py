@@ -281,28 +281,43 @@ def expand_specs(gain_terms):
     n_t_chunks = n_t_chunks.pop()
     n_f_chunks = n_f_chunks.pop()
 
+    # Pull the per-term attributes out of the datasets once - attribute
+    # access on an xarray.Dataset is comparatively expensive and these do not
+    # vary between chunks.
+    term_attrs = []
+    for xds in gain_terms.values():
+
+        gain_chunk_spec = xds.GAIN_SPEC
+        parm_chunk_spec = getattr(xds, "PARAM_SPEC", ())
+
+        term_attrs.append(
+            (
+                xds.NAME,
+                xds.TYPE,
+                gain_chunk_spec,
+                parm_chunk_spec,
+                gain_chunk_spec.achunk[0],  # No chunking.
+                gain_chunk_spec.dchunk[0],  # No chunking.
+                gain_chunk_spec.cchunk[0]  # No chunking.
+            )
+        )
+
     tc_list = []
     for tc_ind in range(n_t_chunks):
         fc_list = []
         for fc_ind in range(n_f_chunks):
             term_list = []
-            for xds in gain_terms.values():
+            for attrs in term_attrs:
 
-                term_name = xds.NAME
-                term_type = xds.TYPE
-                gain_chunk_spec = xds.GAIN_SPEC
+                (term_name, term_type, gain_chunk_spec, parm_chunk_spec,
+                 ac, dc, cc) = attrs
 
                 tc = gain_chunk_spec.tchunk[tc_ind]
                 fc = gain_chunk_spec.fchunk[fc_ind]
 
-                ac = gain_chunk_spec.achunk[0]  # No chunking.
-                dc = gain_chunk_spec.dchunk[0]  # No chunking.
-                cc = gain_chunk_spec.cchunk[0]  # No chunking.
-
                 term_shape = (tc, fc, ac, dc, cc)
 
                 # Check if we have a spec for the parameters.
-                parm_chunk_spec = getattr(xds, "PARAM_SPEC", ())
                 if parm_chunk_spec:
                     tc_p = parm_chunk_spec.tchunk[tc_ind]
                     fc_p = parm_chunk_spec.fchunk[fc_ind]
@@ -12,29 +12,37 @@ def make_mapping_datasets(data_xds_list, chain):
 
         mappings = {}
 
-        for gain_obj in chain:
+        # Check whether we are dealing with BDA data.
+        if hasattr(data_xds, "UPSAMPLED_TIME"):
+            time_col = data_xds.UPSAMPLED_TIME.data
+            interval_col = data_xds.UPSAMPLED_INTERVAL.data
+        else:
+            time_col = data_xds.TIME.data
+            interval_col = data_xds.INTERVAL.data
+
+        # If SCAN_NUMBER was a partitioning column it will not be present
+        # on the dataset - we reintroduce it for cases where we need to
+        # ensure solution intervals don't span scan boundaries.
+        # TODO: This could actually be moved to the underlying code by
+        # passing in/handling None.
+        if "SCAN_NUMBER" in data_xds.data_vars.keys():
+            scan_col = data_xds.SCAN_NUMBER.data
+        else:
+            scan_col = da.zeros_like(
+                time_col,
+                dtype=np.int32,
+                name="scan_number-" + uuid4().hex
+            )
 
-            # Check whether we are dealing with BDA data.
-            if hasattr(data_xds, "UPSAMPLED_TIME"):
-                time_col = data_xds.UPSAMPLED_TIME.data
-                interval_col = data_xds.UPSAMPLED_INTERVAL.data
-            else:
-                time_col = data_xds.TIME.data
-                interval_col = data_xds.INTERVAL.data
-
-            # If SCAN_NUMBER was a partitioning column it will not be present
-            # on the dataset - we reintroduce it for cases where we need to
-            # ensure solution intervals don't span scan boundaries.
-            # TODO: This could actually be moved to the underlying code by
-            # passing in/handling None.
-            if "SCAN_NUMBER" in data_xds.data_vars.keys():
-                scan_col = data_xds.SCAN_NUMBER.data
-            else:
-                scan_col = da.zeros_like(
-                    time_col,
-                    dtype=np.int32,
-                    name="scan_number-" + uuid4().hex
-                )
+        # The row to unique time mapping is common to all terms - compute it
+        # once per dataset so that each time map is a simple lookup.
+        utime_inv = da.map_blocks(
+            _make_utime_inverse,
+            time_col,
+            dtype=np.int64
+        )
+
+        for gain_obj in chain:
 
             time_interval = gain_obj.time_interval
             respect_scan_boundaries = gain_obj.respect_scan_boundaries
@@ -49,7 +57,7 @@ def make_mapping_datasets(data_xds_list, chain):
             )
 
             time_map = gain_obj.make_time_map(
-                time_col,
+                utime_inv,
                 time_bins
             )
 
@@ -86,7 +94,7 @@ def make_mapping_datasets(data_xds_list, chain):
                 )
 
                 param_time_map = gain_obj.make_time_map(
-                    time_col,
+                    utime_inv,
                     param_time_bins
                 )
 
@@ -109,3 +117,10 @@ def make_mapping_datasets(data_xds_list, chain):
         mapping_xds_list.append(xarray.Dataset(mappings))
 
     return mapping_xds_list
+
+
+def _make_utime_inverse(time_col):
+
+    _, utime_inv = np.unique(time_col, return_inverse=True)
+
+    return utime_inv
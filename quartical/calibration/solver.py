@@ -5,7 +5,8 @@ from numba import set_num_threads
 from collections import namedtuple
 from itertools import cycle
 from quartical.weights.robust import robust_reweighting
-from quartical.statistics.stat_kernels import compute_mean_postsolve_chisq
+from quartical.statistics.stat_kernels import (compute_mean_presolve_chisq,
+                                               compute_mean_postsolve_chisq)
 from quartical.statistics.logging import log_chisq
 
 
@@ -34,6 +35,16 @@ def make_mapping_tuple(dictionary, field, default=None):
     )
 
 
+def is_identity(gains):
+    """Check whether a gain array consists solely of identity elements."""
+
+    if gains.shape[-1] == 4:
+        diag, offdiag = gains[..., (0, 3)], gains[..., (1, 2)]
+        return np.all(diag == 1) and np.all(offdiag == 0)
+    else:
+        return np.all(gains == 1)
+
+
 def make_per_term_kwargs(kwargs, chain):
 
     per_term_kwargs = {}
@@ -171,21 +182,34 @@ def solver_wrapper(
         icovariance = np.zeros(corr_mode, np.float64)
         dof = 5  # TODO: Expose?
 
-    presolve_chisq = compute_mean_postsolve_chisq(
-        ms_kwargs["DATA"],
-        ms_kwargs["MODEL_DATA"],
-        ms_kwargs["WEIGHT"],
-        ms_kwargs["FLAG"],
-        ms_kwargs["ANTENNA1"],
-        ms_kwargs["ANTENNA2"],
-        ms_kwargs["ROW_MAP"],
-        ms_kwargs["ROW_WEIGHTS"],
-        chain_kwargs["gains"],
-        mapping_kwargs["time_maps"],
-        mapping_kwargs["freq_maps"],
-        mapping_kwargs["dir_maps"],
-        corr_mode
-    )
+    # If no term has been initialised away from the identity, the gains do
+    # not contribute to the pre-solve chisq and we can skip applying them.
+    if all(is_identity(g) for g in chain_kwargs["gains"]):
+        presolve_chisq = compute_mean_presolve_chisq(
+            ms_kwargs["DATA"],
+            ms_kwargs["MODEL_DATA"],
+            ms_kwargs["WEIGHT"],
+            ms_kwargs["FLAG"],
+            ms_kwargs["ROW_MAP"],
+            ms_kwargs["ROW_WEIGHTS"],
+            corr_mode
+        )
+    else:
+        presolve_chisq = compute_mean_postsolve_chisq(
+            ms_kwargs["DATA"],
+            ms_kwargs["MODEL_DATA"],
+            ms_kwargs["WEIGHT"],
+            ms_kwargs["FLAG"],
+            ms_kwargs["ANTENNA1"],
+            ms_kwargs["ANTENNA2"],
+            ms_kwargs["ROW_MAP"],
+            ms_kwargs["ROW_WEIGHTS"],
+            chain_kwargs["gains"],
+            mapping_kwargs["time_maps"],
+            mapping_kwargs["freq_maps"],
+            mapping_kwargs["dir_maps"],
+            corr_mode
+        )
 
     for ind, (term, iters) in enumerate(zip(cycle(chain), iter_recipe)):
 
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 from loguru import logger
-import re
-import dask.array as da
+import operator
 from collections import namedtuple
 import os.path
 from dataclasses import dataclass
@@ -28,6 +27,32 @@ class IdentityRecipe(Recipe):
     pass
 
 
+def split_recipe(recipe):
+    """Split a single recipe on its operators in one pass.
+
+    Splits on understood operators, ~ for subtract, + for add, retaining the
+    operators. Equivalent to re.split(r'([\+~])', recipe).
+
+    Args:
+        recipe: A string containing a single model recipe.
+
+    Returns:
+        ingredients: A list of alternating sources and operators.
+    """
+
+    ingredients = []
+    start = 0
+
+    for ind, char in enumerate(recipe):
+        if char in "+~":
+            ingredients.extend((recipe[start:ind], char))
+            start = ind + 1
+
+    ingredients.append(recipe[start:])
+
+    return ingredients
+
+
 def transcribe_recipe(user_recipe):
     """Interpret the model recipe string.
 
@@ -62,13 +87,11 @@ def transcribe_recipe(user_recipe):
 
         instructions[recipe_index] = []
 
-        # A raw string is required to avoid insane escape characters. Splits
-        # on understood operators, ~ for subtract, + for add.
-
-        ingredients = re.split(r'([\+~])', recipe)
+        ingredients = split_recipe(recipe)
 
-        # Behaviour of re.split guarantees every second term is either a column
-        # or .lsm. This may lead to the first element being an empty string.
+        # Behaviour of split_recipe guarantees every second term is either a
+        # column or .lsm. This may lead to the first element being an empty
+        # string.
 
         # Split the ingredients into operations and model sources. We preserve
         # empty strings in the recipe to avoid more complicated code elsewhere.
@@ -77,7 +100,7 @@ def transcribe_recipe(user_recipe):
 
             if ingredient in "~+" and ingredient != "":
 
-                operation = da.add if ingredient == "+" else da.subtract
+                operation = operator.add if ingredient == "+" else operator.sub
                 instructions[recipe_index].append(operation)
 
             elif ".lsm.html" in ingredient:
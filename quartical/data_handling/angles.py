@@ -18,6 +18,20 @@ import quartical.gains.general.factories as factories
 # Simon but I think it may break things for me. Investigate.
 _thread_local = threading.local()
 
+LINEAR_FEEDS = frozenset("XxYy")
+CIRCULAR_FEEDS = frozenset("LlRr")
+
+
+def infer_feed_type(unique_feeds):
+    """Determine the feed type from a set of unique polarization types."""
+
+    if unique_feeds <= LINEAR_FEEDS:
+        return "linear"
+    elif unique_feeds <= CIRCULAR_FEEDS:
+        return "circular"
+    else:
+        raise ValueError("Unsupported feed type/configuration.")
+
 
 def assign_parangle_data(ms_path, data_xds_list):
 
@@ -35,12 +49,7 @@ def assign_parangle_data(ms_path, data_xds_list):
         for pt in xds.POLARIZATION_TYPE.values.ravel()
     }
 
-    if np.all([feed in "XxYy" for feed in unique_feeds]):
-        feed_type = "linear"
-    elif np.all([feed in "LlRr" for feed in unique_feeds]):
-        feed_type = "circular"
-    else:
-        raise ValueError("Unsupported feed type/configuration.")
+    feed_type = infer_feed_type(unique_feeds)
 
     phase_dirs = fieldtab.PHASE_DIR.values
 
@@ -80,15 +89,9 @@ def make_parangle_xds_list(ms_path, data_xds_list):
     fieldtab = xds_from_storage_table(ms_path + "::FIELD")[0]
 
     # We do this eagerly to make life easier.
-    feeds = feedtab.POLARIZATION_TYPE.values
-    unique_feeds = np.unique(feeds)
+    unique_feeds = set(feedtab.POLARIZATION_TYPE.values.ravel())
 
-    if np.all([feed in "XxYy" for feed in unique_feeds]):
-        feed_type = "linear"
-    elif np.all([feed in "LlRr" for feed in unique_feeds]):
-        feed_type = "circular"
-    else:
-        raise ValueError("Unsupported feed type/configuration.")
+    feed_type = infer_feed_type(unique_feeds)
 
     phase_dirs = fieldtab.PHASE_DIR.data
 
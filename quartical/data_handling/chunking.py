@@ -2,6 +2,9 @@ import dask.delayed as dd
 import numpy as np
 import dask.array as da
 from daskms import xds_from_storage_ms, xds_from_storage_table
+from numba import njit
+from quartical.utils.maths import unique_sorted
+from quartical.utils.numba import JIT_OPTIONS
 
 
 def compute_chunking(ms_opts, compute=True):
@@ -53,7 +56,11 @@ def compute_chunking(ms_opts, compute=True):
             chunking_per_spw_xds
         )
     else:
-        utime_chunking_per_xds, chunking_per_data_xds, chunking_per_spw_xds
+        return (
+            utime_chunking_per_xds,
+            chunking_per_data_xds,
+            chunking_per_spw_xds
+        )
 
 
 def chan_chunking(
@@ -86,24 +93,7 @@ def chan_chunking(
 
         if isinstance(freq_chunk, float):
 
-            def interval_chunking(chan_widths, freq_chunk):
-
-                chunks = ()
-                bin_width = 0
-                bin_nchan = 0
-                for width in chan_widths:
-                    bin_width += width
-                    bin_nchan += 1
-                    if bin_width > freq_chunk:
-                        chunks += (bin_nchan,)
-                        bin_width = 0
-                        bin_nchan = 0
-                if bin_width:
-                    chunks += (bin_nchan,)
-
-                return np.array(chunks, dtype=np.int32)
-
-            chunking = da.map_blocks(interval_chunking,
+            chunking = da.map_blocks(_chan_interval_chunking,
                                      xds.CHAN_WIDTH.data[0],
                                      freq_chunk,
                                      chunks=((np.nan,),),
@@ -111,23 +101,7 @@ def chan_chunking(
 
         else:
 
-            def integer_chunking(chan_widths, freq_chunk):
-
-                n_chan = chan_widths.size
-                freq_chunk = freq_chunk or n_chan  # Catch zero case.
-
-                chunk_starts = np.arange(0, n_chan, freq_chunk)
-
-                chunks = np.array(
-                    [
-                        freq_chunk if i + freq_chunk < n_chan else n_chan - i
-                        for i in chunk_starts
-                    ]
-                )
-
-                return chunks.astype(np.int32)
-
-            chunking = da.map_blocks(integer_chunking,
+            chunking = da.map_blocks(_chan_integer_chunking,
                                      xds.CHAN_WIDTH.data[0],
                                      freq_chunk,
                                      chunks=((np.nan,),),
@@ -176,27 +150,8 @@ def row_chunking(
 
         if isinstance(time_chunk, float):
 
-            def interval_chunking(time_col, interval_col, time_chunk):
-                """Given a time column, figure out interval chunking."""
-
-                _, uinds, ucounts = \
-                    np.unique(time_col, return_counts=True, return_index=True)
-                cumulative_interval = np.cumsum(interval_col[uinds])
-                cumulative_interval -= cumulative_interval[0]
-                chunk_map = \
-                    (cumulative_interval // time_chunk).astype(np.int32)
-
-                _, utime_chunks = np.unique(chunk_map, return_counts=True)
-
-                chunk_starts = np.zeros(utime_chunks.size, dtype=np.int32)
-                chunk_starts[1:] = np.cumsum(utime_chunks)[:-1]
-
-                row_chunks = np.add.reduceat(ucounts, chunk_starts)
-
-                return np.vstack((utime_chunks, row_chunks)).astype(np.int32)
-
             chunking = da.map_blocks(
-                interval_chunking,
+                _row_interval_chunking,
                 xds.TIME.data,
                 xds.INTERVAL.data,
                 time_chunk,
@@ -206,28 +161,8 @@ def row_chunking(
 
         else:
 
-            def integer_chunking(time_col, time_chunk):
-                """Given a time column, figure out integer chunking."""
-
-                utimes, ucounts = np.unique(time_col, return_counts=True)
-                n_utime = utimes.size
-                time_chunk = time_chunk or n_utime  # Catch 0.
-
-                chunk_starts = np.arange(0, n_utime, time_chunk)
-
-                utime_chunks = np.array(
-                    [
-                        time_chunk if i + time_chunk < n_utime else n_utime - i
-                        for i in chunk_starts
-                    ]
-                )
-
-                row_chunks = np.add.reduceat(ucounts, chunk_starts)
-
-                return np.vstack((utime_chunks, row_chunks)).astype(np.int32)
-
             chunking = da.map_blocks(
-                integer_chunking,
+                _row_integer_chunking,
                 xds.TIME.data,
                 time_chunk,
                 chunks=((2,), (np.nan,)),
@@ -246,3 +181,104 @@ def row_chunking(
         return da.compute(utime_chunking_per_xds, row_chunking_per_xds)
     else:
         return utime_chunking_per_xds, row_chunking_per_xds
+
+
+@njit(**JIT_OPTIONS)
+def _chan_interval_chunking(chan_widths, freq_chunk):
+    """Given channel widths, figure out bandwidth chunking."""
+
+    chunks = np.empty(chan_widths.size, dtype=np.int32)
+
+    n_chunk = 0
+    bin_width = 0.0
+    bin_nchan = 0
+    for width in chan_widths:
+        bin_width += width
+        bin_nchan += 1
+        if bin_width > freq_chunk:
+            chunks[n_chunk] = bin_nchan
+            n_chunk += 1
+            bin_width = 0.0
+            bin_nchan = 0
+    if bin_width:
+        chunks[n_chunk] = bin_nchan
+        n_chunk += 1
+
+    return chunks[:n_chunk]
+
+
+def _chan_integer_chunking(chan_widths, freq_chunk):
+    """Given channel widths, figure out integer chunking."""
+
+    n_chan = chan_widths.size
+    freq_chunk = freq_chunk or n_chan  # Catch zero case.
+
+    chunk_starts = np.arange(0, n_chan, freq_chunk)
+
+    # The final chunk may be smaller than freq_chunk.
+    chunks = np.minimum(freq_chunk, n_chan - chunk_starts)
+
+    return chunks.astype(np.int32)
+
+
+@njit(**JIT_OPTIONS)
+def _row_interval_chunking(time_col, interval_col, time_chunk):
+    """Given a time column, figure out interval chunking.
+
+    Requires a single pass over the rows - TIME is the indexing column so it
+    is already sorted and unique times can be detected on the fly.
+    """
+
+    n_row = time_col.size
+
+    utime_chunks = np.zeros(n_row, dtype=np.int32)
+    row_chunks = np.zeros(n_row, dtype=np.int32)
+
+    n_chunk = 0
+    chunk_ind = -1
+    cumulative_interval = 0.0
+    initial_interval = 0.0
+
+    for row in range(n_row):
+
+        if row == 0 or time_col[row] != time_col[row - 1]:
+            # Offset by the first interval (as opposed to skipping it)
+            # to be consistent with a cumsum over the unique intervals.
+            cumulative_interval += interval_col[row]
+            if row == 0:
+                initial_interval = cumulative_interval
+
+            offset_interval = cumulative_interval - initial_interval
+            new_chunk_ind = int(offset_interval // time_chunk)
+
+            if new_chunk_ind != chunk_ind:
+                chunk_ind = new_chunk_ind
+                n_chunk += 1
+
+            utime_chunks[n_chunk - 1] += 1
+
+        row_chunks[n_chunk - 1] += 1
+
+    chunking = np.empty((2, n_chunk), dtype=np.int32)
+    chunking[0] = utime_chunks[:n_chunk]
+    chunking[1] = row_chunks[:n_chunk]
+
+    return chunking
+
+
+def _row_integer_chunking(time_col, time_chunk):
+    """Given a time column, figure out integer chunking."""
+
+    # NOTE: TIME is the indexing column so it is already sorted.
+    utimes, _, ucounts = unique_sorted(time_col)
+    n_utime = utimes.size
+    time_chunk = time_chunk or n_utime  # Catch 0.
+
+    chunk_starts = np.arange(0, n_utime, time_chunk)
+
+    # The final chunk may be smaller than time_chunk.
+    utime_chunks = np.minimum(time_chunk, n_utime - chunk_starts)
+
+    row_chunks = np.add.reduceat(ucounts, chunk_starts)
+
+    return np.vstack((utime_chunks, row_chunks)).astype(np.int32)
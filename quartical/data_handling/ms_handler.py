@@ -6,6 +6,7 @@ from daskms import (xds_from_storage_ms,
                     xds_from_storage_table,
                     xds_to_storage_table)
 from dask.graph_manipulation import clone
+from numba import njit
 from loguru import logger
 from quartical.weights.weights import initialize_weights
 from quartical.flagging.flagging import initialise_flags
@@ -36,6 +37,17 @@ def read_xds_list(model_columns, ms_opts):
     """
 
     antenna_xds = xds_from_storage_table(ms_opts.path + "::ANTENNA")[0]
+    pol_xds = xds_from_storage_table(ms_opts.path + "::POLARIZATION")[0]
+    field_xds = xds_from_storage_table(ms_opts.path + "::FIELD")[0]
+
+    # Read the small subtable columns required below eagerly, but in a single
+    # compute call rather than one per column.
+    ant_names, corr_type_ids, phase_dir, field_names = da.compute(
+        antenna_xds.NAME.data,
+        pol_xds.CORR_TYPE.data[0],
+        field_xds.PHASE_DIR.data,
+        field_xds.NAME.data
+    )
 
     n_ant = antenna_xds.sizes["row"]
 
@@ -43,10 +55,8 @@ def read_xds_list(model_columns, ms_opts):
                 "observation.", n_ant)
 
     # Determine the number/type of correlations present in the measurement set.
-    pol_xds = xds_from_storage_table(ms_opts.path + "::POLARIZATION")[0]
-
     try:
-        corr_types = [CORR_TYPES[ct] for ct in pol_xds.CORR_TYPE.values[0]]
+        corr_types = [CORR_TYPES[ct] for ct in corr_type_ids]
     except KeyError:
         raise KeyError("Data contains unsupported correlation products.")
 
@@ -63,9 +73,7 @@ def read_xds_list(model_columns, ms_opts):
     # probably need to be done on a per xds basis. Can probably be accomplished
     # by merging the field xds grouped by DDID into data grouped by DDID.
 
-    field_xds = xds_from_storage_table(ms_opts.path + "::FIELD")[0]
-    phase_dir = np.squeeze(field_xds.PHASE_DIR.values)
-    field_names = field_xds.NAME.values
+    phase_dir = np.squeeze(phase_dir)
 
     logger.info("Field table indicates phase centre is at ({} {}).",
                 phase_dir[0], phase_dir[1])
@@ -141,7 +149,7 @@ def read_xds_list(model_columns, ms_opts):
     _data_xds_list = []
 
     corr_types = np.array(corr_types, dtype='U')
-    ant_names = np.array(antenna_xds.NAME.values, dtype='U')
+    ant_names = np.array(ant_names, dtype='U')
 
     for xds_ind, xds in enumerate(data_xds_list):
         # Add coordinates to the xarray datasets.
@@ -264,14 +272,6 @@ def write_xds_list(xds_list, ref_xds_list, ms_path, output_opts):
     output_cols = ("FLAG", "FLAG_ROW") if output_opts.flags else ()
 
     if output_opts.products:
-        # Special case - we need to sum over direction.
-        if "model_data" in output_opts.products:
-            models = [xds.MODEL_DATA.data.sum(axis=2) for xds in xds_list]
-            xds_list = [
-                xds.assign({"_MODEL_DATA": (('row', 'chan', 'corr'), model)})
-                for model, xds in zip(models, xds_list)
-            ]
-
         # Drop variables from columns we intend to overwrite.
         xds_list = [xds.drop_vars(output_opts.columns, errors="ignore")
                     for xds in xds_list]
@@ -354,9 +354,12 @@ def preprocess_xds_list(xds_list, ms_opts):
         ant2_col = xds.ANTENNA2.data
 
         # Anywhere we have a broken datapoint, zero it. These points will
-        # be flagged below. TODO: This can be optimized.
+        # be flagged below.
 
-        data_col = da.where(da.isfinite(data_col), data_col, 0)
+        data_col = data_col.map_blocks(
+            _zero_nonfinite,
+            dtype=data_col.dtype
+        )
 
         weight_col = initialize_weights(xds,
                                         data_col,
@@ -404,6 +407,23 @@ def preprocess_xds_list(xds_list, ms_opts):
     return output_xds_list
 
 
+@njit(nogil=True, cache=True)  # No fastmath - it may elide isfinite.
+def _zero_nonfinite(data):
+    """Return a copy of data in which non-finite entries are set to zero."""
+
+    n_row, n_chan, n_corr = data.shape
+
+    out = np.empty_like(data)
+
+    for r in range(n_row):
+        for f in range(n_chan):
+            for c in range(n_corr):
+                v = data[r, f, c]
+                out[r, f, c] = v if np.isfinite(v) else 0
+
+    return out
+
+
 def postprocess_xds_list(data_xds_list, parangle_xds_list, output_opts):
     """Adds data postprocessing steps.
 
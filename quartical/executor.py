@@ -84,7 +84,7 @@ def _execute(exitstack):
                 processes=dask_opts.workers > 1,
                 n_workers=dask_opts.workers,
                 threads_per_worker=dask_opts.threads,
-                memory_limit=0
+                memory_limit=dask_opts.memory_limit
             )
             cluster = exitstack.enter_context(cluster)
             client = exitstack.enter_context(Client(cluster))
@@ -2,7 +2,8 @@ import dask.array as da
 import numpy as np
 from uuid import uuid4
 from loguru import logger  # noqa
-from quartical.flagging.flagging_kernels import (compute_bl_mad_and_med,
+from quartical.flagging.flagging_kernels import (compute_initial_flags,
+                                                 compute_bl_mad_and_med,
                                                  compute_gbl_mad_and_med,
                                                  compute_whitened_residual,
                                                  compute_mad_flags)
@@ -28,20 +29,19 @@ def finalise_flags(xds_list):
         data_col = xds.DATA.data
         flag_col = xds.FLAG.data
 
-        # Remove QuartiCal's temporary flagging.
-        flag_col = da.where(flag_col == -1, 0, flag_col)
+        # Remove QuartiCal's temporary flagging and convert back to a boolean
+        # array. This is done before broadcasting so that we never operate on
+        # a DATA-sized integer array.
+        flag_col = flag_col > 0
+
+        # Make the FLAG_ROW column consistent with FLAG.
+        flag_row_col = da.all(flag_col, axis=1)
 
         # Reintroduce the correlation axis.
         flag_col = da.broadcast_to(flag_col[:, :, None],
                                    data_col.shape,
                                    chunks=data_col.chunks)
 
-        # Convert back to a boolean array.
-        flag_col = flag_col.astype(bool)
-
-        # Make the FLAG_ROW column consistent with FLAG.
-        flag_row_col = da.all(flag_col, axis=(1, 2))
-
         updated_xds = xds.assign(
             {
                 "FLAG": (xds.DATA.dims, flag_col),
@@ -70,53 +70,18 @@ def initialise_flags(data_col, weight_col, flag_col, flag_row_col):
         flags: A dask.array containing the initialized aggregate flags.
     """
 
-    return da.blockwise(_initialise_flags, ("rowlike", "chan"),
+    return da.blockwise(compute_initial_flags, ("rowlike", "chan"),
                         data_col, ("rowlike", "chan", "corr"),
                         weight_col, ("rowlike", "chan", "corr"),
                         flag_col, ("rowlike", "chan", "corr"),
                         flag_row_col, ("rowlike",),
                         dtype=np.int8,
-                        name="init_flags-" + uuid4().hex,
+                        token="init_flags",
                         adjust_chunks=data_col.chunks,
                         align_arrays=False,
                         concatenate=True)
 
 
-def _initialise_flags(data_col, weight_col, flag_col, flag_row_col):
-    """See docstring for initialise_flags."""
-
-    # Combine the flags from both the flag and flag_row columns.
-    flags = flag_col | flag_row_col[:, None, None]
-
-    # The following does some sanity checking on the input data and
-    # weights. Specifically, we look for points with missing/broken data, and
-    # points with null weights. TODO: We can do this with a much smaller
-    # memory footprint by passing this into a numba loop which makes these
-    # decisions per element.
-
-    # We assume that the first and last entries of the correlation axis
-    # are the on-diagonal terms. TODO: This should be safe provided we don't
-    # have off-diagonal only data, although in that case the flagging
-    # logic is probablly equally applicable.
-
-    n_corr = data_col.shape[-1]
-    start = 0
-    stop = n_corr
-    step = 3 if n_corr == 4 else 1
-    corr_sel = slice(start, stop, step)
-
-    missing_points = np.any(data_col[..., corr_sel] == 0, axis=-1)
-    flags[missing_points] = True
-
-    noweight_points = np.any(weight_col[..., corr_sel] == 0, axis=-1)
-    flags[noweight_points] = True
-
-    # At this point, if any correlation is flagged, flag other correlations.
-    flags = np.any(flags, axis=-1).astype(np.int8)
-
-    return flags
-
-
 def valid_median(arr):
     return np.median(arr[np.isfinite(arr) & (arr > 0)], keepdims=True)
 
@@ -225,9 +190,10 @@ def add_mad_graph(data_xds_list, mad_opts):
 
         row_chunks = residuals.chunks[0]
 
-        mad_flags = da.blockwise(
+        flag_col = da.blockwise(
             compute_mad_flags, ("rowlike", "chan"),
             wres, ("rowlike", "chan", "corr"),
+            flag_col, ("rowlike", "chan"),
             gbl_mad_and_med_real, ("rowlike", "chan", "corr", "est"),
             gbl_mad_and_med_imag, ("rowlike", "chan", "corr", "est"),
             bl_mad_and_med_real, ("rowlike", "chan", "bl", "corr", "est"),
@@ -245,8 +211,6 @@ def add_mad_graph(data_xds_list, mad_opts):
             adjust_chunks={"rowlike": row_chunks},
         )
 
-        flag_col = da.where(mad_flags, 1, flag_col)
-
         flagged_data_xds = xds.assign({"FLAG": (("row", "chan"), flag_col)})
 
         flagged_data_xds_list.append(flagged_data_xds)
@@ -8,6 +8,43 @@ def get_bl_ids(a1, a2, n_ant):
     return a1*(2*n_ant - a1 - 1)//2 + a2
 
 
+@njit(nogil=True, cache=True)  # No fastmath - weights may contain NaNs.
+def compute_initial_flags(data_col, weight_col, flag_col, flag_row_col):
+    """Combine the input flags with flags for missing data and null weights.
+
+    We assume that the first and last entries of the correlation axis are the
+    on-diagonal terms and only consider those when checking the data and
+    weights. A point flagged in any correlation is flagged in all of them.
+    """
+
+    n_row, n_chan, n_corr = data_col.shape
+
+    flags = np.zeros((n_row, n_chan), dtype=np.int8)
+
+    diag_step = 3 if n_corr == 4 else 1
+
+    for r in range(n_row):
+
+        if flag_row_col[r]:
+            flags[r] = 1
+            continue
+
+        for f in range(n_chan):
+
+            flagged = False
+
+            for c in range(n_corr):
+                flagged |= flag_col[r, f, c]
+
+            for c in range(0, n_corr, diag_step):
+                flagged |= data_col[r, f, c] == 0
+                flagged |= weight_col[r, f, c] == 0
+
+            flags[r, f] = flagged
+
+    return flags
+
+
 @njit(**JIT_OPTIONS)
 def compute_whitened_residual(resid_arr, weights):
 
@@ -90,6 +127,7 @@ def compute_gbl_mad_and_med(wres, flags):
 @njit(**JIT_OPTIONS)
 def compute_mad_flags(
     wres,
+    flag_col,
     gbl_mad_and_med_real,
     gbl_mad_and_med_imag,
     bl_mad_and_med_real,
@@ -107,7 +145,8 @@ def compute_mad_flags(
 
     bl_ids = get_bl_ids(ant1, ant2, n_ant)
 
-    flags = np.zeros((n_row, n_chan), dtype=np.int8)
+    # MAD flags are merged directly into a copy of the existing flags.
+    flags = flag_col.copy()
 
     scale_factor = 1.4826
 
@@ -4,7 +4,8 @@ from quartical.gains.conversion import no_op
 from quartical.gains.parameterized_gain import ParameterizedGain
 from quartical.gains.delay.kernel import (
     delay_solver,
-    delay_params_to_gains
+    delay_params_to_gains,
+    estimate_delays
 )
 from quartical.gains.general.flagging import (
     apply_gain_flags_to_gains,
@@ -74,89 +75,23 @@ class Delay(ParameterizedGain):
 
             return gains, gain_flags, params, param_flags
 
-        data = ms_kwargs["DATA"]  # (row, chan, corr)
-        flags = ms_kwargs["FLAG"]  # (row, chan)
-        a1 = ms_kwargs["ANTENNA1"]
-        a2 = ms_kwargs["ANTENNA2"]
-        chan_freq = ms_kwargs["CHAN_FREQ"]
-        t_map = term_kwargs[f"{term_spec.name}_time_map"]
-        f_map = term_kwargs[f"{term_spec.name}_param_freq_map"]
-        _, n_chan, n_ant, n_dir, n_corr = gains.shape
-
-        # We only need the baselines which include the ref_ant.
-        sel = np.where((a1 == ref_ant) | (a2 == ref_ant))
-        a1 = a1[sel]
-        a2 = a2[sel]
-        t_map = t_map[sel]
-        data = data[sel]
-        flags = flags[sel]
-
-        data[flags == 1] = 0  # Ignore UV-cut, otherwise there may be no est.
-
-        utint = np.unique(t_map)
-        ufint = np.unique(f_map)
-
-        for ut in utint:
-            sel = np.where((t_map == ut) & (a1 != a2))
-            ant_map_pq = np.where(a1[sel] == ref_ant, a2[sel], 0)
-            ant_map_qp = np.where(a2[sel] == ref_ant, a1[sel], 0)
-            ant_map = ant_map_pq + ant_map_qp
-
-            ref_data = np.zeros((n_ant, n_chan, n_corr), dtype=np.complex128)
-            counts = np.zeros((n_ant, n_chan), dtype=int)
-            np.add.at(
-                ref_data,
-                ant_map,
-                data[sel]
-            )
-            np.add.at(
-                counts,
-                ant_map,
-                flags[sel] == 0
-            )
-            np.divide(
-                ref_data,
-                counts[:, :, None],
-                where=counts[:, :, None] != 0,
-                out=ref_data
-            )
-
-            for uf in ufint:
-
-                fsel = np.where(f_map == uf)[0]
-                sel_n_chan = fsel.size
-                n = int(np.ceil(2 ** 15 / sel_n_chan)) * sel_n_chan
-
-                fsel_data = ref_data[:, fsel]
-                valid_ant = fsel_data.any(axis=(1, 2))
-
-                fft_data = np.abs(
-                    np.fft.fft(fsel_data, n=n, axis=1)
-                )
-                fft_data = np.fft.fftshift(fft_data, axes=1)
-
-                delta_freq = chan_freq[1] - chan_freq[0]
-                fft_freq = np.fft.fftfreq(n, delta_freq)
-                fft_freq = np.fft.fftshift(fft_freq)
-
-                delay_est_ind_00 = np.argmax(fft_data[..., 0], axis=1)
-                delay_est_00 = fft_freq[delay_est_ind_00]
-                delay_est_00[~valid_ant] = 0
-
-                if n_corr > 1:
-                    delay_est_ind_11 = np.argmax(fft_data[..., -1], axis=1)
-                    delay_est_11 = fft_freq[delay_est_ind_11]
-                    delay_est_11[~valid_ant] = 0
-
-                for t, p, q in zip(t_map[sel], a1[sel], a2[sel]):
-                    if p == ref_ant:
-                        params[t, uf, q, 0, 0] = -delay_est_00[q]
-                        if n_corr > 1:
-                            params[t, uf, q, 0, 1] = -delay_est_11[q]
-                    else:
-                        params[t, uf, p, 0, 0] = delay_est_00[p]
-                        if n_corr > 1:
-                            params[t, uf, p, 0, 1] = delay_est_11[p]
+        _, _, n_ant, _, n_corr = gains.shape
+
+        t_ind, f_ind, a_ind, delay_est = estimate_delays(
+            ms_kwargs["DATA"],
+            ms_kwargs["FLAG"],
+            ms_kwargs["ANTENNA1"],
+            ms_kwargs["ANTENNA2"],
+            ms_kwargs["CHAN_FREQ"],
+            term_kwargs[f"{term_spec.name}_time_map"],
+            term_kwargs[f"{term_spec.name}_param_freq_map"],
+            ref_ant,
+            n_ant
+        )
+
+        params[t_ind, f_ind, a_ind, 0, 0] = delay_est[..., 0]
+        if n_corr > 1:
+            params[t_ind, f_ind, a_ind, 0, 1] = delay_est[..., -1]
 
         delay_params_to_gains(
             params,
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import numpy as np
+import scipy.fft
 from numba import njit, prange
 from numba.extending import overload
 from quartical.utils.numba import (
@@ -546,7 +547,7 @@ def finalize_update(
     raise NotImplementedError
 
 
-@overload(finalize_update, jit_options=JIT_OPTIONS)
+@overload(finalize_update, jit_options=PARALLEL_JIT_OPTIONS)
 def nb_finalize_update(
     ms_inputs,
     mapping_inputs,
@@ -600,22 +601,27 @@ def nb_finalize_update(
             cf_max = chan_freq.max()
             cf_mid = (cf_min + cf_max) / 2
 
-            for t in range(n_time):
-                for f in range(n_freq):
-                    f_m = param_freq_map[f]
-                    coeff = 2 * np.pi * (chan_freq[f]/cf_mid - 1)
-                    for a in range(n_ant):
-                        for d in range(n_dir):
-
-                            d_m = dir_map[d]
-                            g = gain[t, f, a, d]
-                            fl = gain_flags[t, f, a, d]
-                            p = params[t, f_m, a, d_m]
-
-                            if fl == 1:
-                                set_identity(g)
-                            else:
-                                param_to_gain(p, coeff, g)
+            # Parallel over all (time, freq) pairs.
+            for i in prange(n_time * n_freq):
+
+                t = i//n_freq
+                f = i - t*n_freq
+
+                f_m = param_freq_map[f]
+                coeff = 2 * np.pi * (chan_freq[f]/cf_mid - 1)
+
+                for a in range(n_ant):
+                    for d in range(n_dir):
+
+                        d_m = dir_map[d]
+                        g = gain[t, f, a, d]
+                        fl = gain_flags[t, f, a, d]
+                        p = params[t, f_m, a, d_m]
+
+                        if fl == 1:
+                            set_identity(g)
+                        else:
+                            param_to_gain(p, coeff, g)
     else:
         raise ValueError("Unsupported number of correlations.")
 
@@ -860,3 +866,118 @@ def reference_params(ms_inputs, mapping_inputs, chain_inputs, meta_inputs):
     # Referencing may move flagged gains/params from identity.
     apply_param_flags_to_params(param_flags, params, 0)
     apply_gain_flags_to_gains(gain_flags, gains)
+
+
+def estimate_delays(data, flags, a1, a2, chan_freq, t_map, f_map, ref_ant,
+                    n_ant):
+    """Estimate delays relative to the reference antenna using an FFT.
+
+    Averages the data on each baseline to the reference antenna per time
+    interval and locates the peak of its zero-padded FFT per frequency
+    interval. Only the diagonal correlations are considered.
+
+    Args:
+        data: A (row, chan, corr) np.ndarray containing the data.
+        flags: A (row, chan) np.ndarray containing the flags.
+        a1: A (row,) np.ndarray containing the first antenna indices.
+        a2: A (row,) np.ndarray containing the second antenna indices.
+        chan_freq: A (chan,) np.ndarray containing the channel frequencies.
+        t_map: A (row,) np.ndarray mapping rows to time intervals.
+        f_map: A (chan,) np.ndarray mapping channels to frequency intervals.
+        ref_ant: The index of the reference antenna.
+        n_ant: The number of antennas.
+
+    Returns:
+        A tuple of time, frequency and antenna index arrays, broadcastable
+        to (baseline, freq_int), and a (baseline, freq_int, diag_corr)
+        np.ndarray containing the corresponding delay estimates.
+    """
+
+    n_chan, n_corr = data.shape[1:]
+
+    # We only need the (non-auto) baselines which include the ref_ant.
+    sel = np.where(((a1 == ref_ant) | (a2 == ref_ant)) & (a1 != a2))
+    a1 = a1[sel]
+    a2 = a2[sel]
+    t_map = t_map[sel]
+    data = data[sel]
+    flags = flags[sel]
+
+    data[flags == 1] = 0  # Ignore UV-cut, otherwise there may be no est.
+
+    # Estimates are relative to the reference antenna, so flip the sign when
+    # it appears as the first antenna of the baseline.
+    ant_map = np.where(a1 == ref_ant, a2, a1)
+    sign = np.where(a1 == ref_ant, -1, 1)
+
+    corr_sel = (0, -1) if n_corr > 1 else (0,)
+
+    utint = np.unique(t_map)
+    ufint = np.unique(f_map)
+
+    delta_freq = chan_freq[1] - chan_freq[0]
+
+    # The padded transform depends only on the channels in each frequency
+    # interval, so set it up once rather than for every time interval.
+    freq_setup = []
+
+    for uf in ufint:
+
+        fsel = np.where(f_map == uf)[0]
+        sel_n_chan = fsel.size
+        n = int(np.ceil(2 ** 15 / sel_n_chan)) * sel_n_chan
+
+        fft_freq = scipy.fft.fftfreq(n, delta_freq)
+        fft_freq = scipy.fft.fftshift(fft_freq)
+
+        freq_setup.append((fsel, n, fft_freq))
+
+    delay_est = np.zeros((ant_map.size, ufint.size, len(corr_sel)))
+
+    for ut in utint:
+
+        tsel = np.where(t_map == ut)[0]
+        t_ant_map = ant_map[tsel]
+
+        # Accumulate per-antenna sums using a sort and a segmented
+        # reduction - this is much faster than np.add.at.
+        order = np.argsort(t_ant_map, kind="stable")
+        uniq_ant, starts = np.unique(t_ant_map[order], return_index=True)
+
+        ref_data = np.zeros((n_ant, n_chan, n_corr), dtype=np.complex128)
+        counts = np.zeros((n_ant, n_chan), dtype=int)
+
+        ref_data[uniq_ant] = np.add.reduceat(
+            data[tsel[order]], starts, axis=0
+        )
+        counts[uniq_ant] = np.add.reduceat(
+            flags[tsel[order]] == 0, starts, axis=0
+        )
+        np.divide(
+            ref_data,
+            counts[:, :, None],
+            where=counts[:, :, None] != 0,
+            out=ref_data
+        )
+
+        for fi, (fsel, n, fft_freq) in enumerate(freq_setup):
+
+            fsel_data = ref_data[:, fsel]
+            valid_ant = fsel_data.any(axis=(1, 2))
+
+            # Only the diagonal correlations contribute to the estimate -
+            # avoid transforming the off-diagonals. A contiguous input lets
+            # the batched transform run over (ant, corr) in one go.
+            fsel_data = np.ascontiguousarray(fsel_data[..., corr_sel])
+
+            fft_data = np.abs(
+                scipy.fft.fft(fsel_data, n=n, axis=1)
+            )
+            fft_data = scipy.fft.fftshift(fft_data, axes=1)
+
+            ant_est = fft_freq[np.argmax(fft_data, axis=1)]
+            ant_est[~valid_ant] = 0
+
+            delay_est[tsel, fi] = sign[tsel, None] * ant_est[t_ant_map]
+
+    return t_map[:, None], ufint[None, :], ant_map[:, None], delay_est
@@ -1,7 +1,9 @@
 from collections import namedtuple
 import numpy as np
 import dask.array as da
+from numba import njit
 from dask.graph_manipulation import clone
+from quartical.utils.numba import JIT_OPTIONS
 from quartical.gains.general.flagging import (
     init_flags, apply_gain_flags_to_gains
 )
@@ -113,7 +115,7 @@ class Gain:
             scan_col,
             time_interval,
             respect_scan_boundaries,
-            dtype=np.int64,
+            dtype=np.int32,
             chunks=chunks
         )
 
@@ -177,22 +179,19 @@ class Gain:
         return time_bins
 
     @classmethod
-    def make_time_map(cls, time_col, time_bins):
+    def make_time_map(cls, utime_inv, time_bins):
 
         time_map = da.map_blocks(
             cls._make_time_map,
-            time_col,
+            utime_inv,
             time_bins,
-            dtype=np.int64
+            dtype=np.int32
         )
 
         return time_map
 
     @classmethod
-    def _make_time_map(cls, time_col, time_bins):
-
-        _, utime_inv = np.unique(time_col, return_inverse=True)
-
+    def _make_time_map(cls, utime_inv, time_bins):
         return time_bins[utime_inv]
 
     @classmethod
@@ -228,11 +227,8 @@ class Gain:
 
         unique_values = np.unique(time_col)
 
-        sums = np.zeros(time_bins.max() + 1, dtype=np.float64)
-        counts = np.zeros_like(sums, dtype=np.int64)
-
-        np.add.at(sums, time_bins, unique_values)
-        np.add.at(counts, time_bins, 1)
+        sums = np.bincount(time_bins, weights=unique_values)
+        counts = np.bincount(time_bins)
 
         return sums / counts
 
@@ -244,7 +240,7 @@ class Gain:
             chan_freqs,
             chan_widths,
             freq_interval,
-            dtype=np.int64
+            dtype=np.int32
         )
 
         return freq_map
@@ -260,14 +256,7 @@ class Gain:
         freq_map = np.empty((n_chan,), dtype=np.int32)
 
         if isinstance(freq_interval, float):
-            net_ivl = 0
-            bin_num = 0
-            for i, ivl in enumerate(chan_widths):
-                freq_map[i] = bin_num
-                net_ivl += ivl
-                if net_ivl >= freq_interval:
-                    net_ivl = 0
-                    bin_num += 1
+            _bandwidth_freq_map(chan_widths, freq_interval, freq_map)
         else:
             freq_map[:] = np.arange(n_chan)//freq_interval
 
@@ -306,11 +295,8 @@ class Gain:
 
         unique_values = np.unique(chan_freq)
 
-        sums = np.zeros(freq_map.max() + 1, dtype=np.float64)
-        counts = np.zeros_like(sums, dtype=np.int64)
-
-        np.add.at(sums, freq_map, unique_values)
-        np.add.at(counts, freq_map, 1)
+        sums = np.bincount(freq_map, weights=unique_values)
+        counts = np.bincount(freq_map)
 
         return sums / counts
 
@@ -369,3 +355,18 @@ class Gain:
         apply_gain_flags_to_gains(gain_flags, gains)
 
         return gains, gain_flags
+
+
+@njit(**JIT_OPTIONS)
+def _bandwidth_freq_map(chan_widths, freq_interval, freq_map):
+    """Populate freq_map for a solution interval specified as a bandwidth."""
+
+    net_ivl = 0.0
+    bin_num = 0
+
+    for i in range(chan_widths.size):
+        freq_map[i] = bin_num
+        net_ivl += chan_widths[i]
+        if net_ivl >= freq_interval:
+            net_ivl = 0.0
+            bin_num += 1
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 import numpy as np
-from numba import prange, njit
+from numba import prange, njit, types
 from numba.typed import List
 from collections import namedtuple
 from numba.extending import overload
-from quartical.utils.numba import JIT_OPTIONS, coerce_literal
+from quartical.utils.numba import (JIT_OPTIONS,
+                                   PARALLEL_JIT_OPTIONS,
+                                   coerce_literal)
 import quartical.gains.general.factories as factories
 from quartical.gains.general.convenience import get_dims, get_row
 
@@ -136,7 +138,7 @@ def compute_residual_impl(
     raise NotImplementedError
 
 
-@overload(compute_residual_impl, jit_options=JIT_OPTIONS)
+@overload(compute_residual_impl, jit_options=PARALLEL_JIT_OPTIONS)
 def nb_compute_residual_impl(
     data,
     model,
@@ -161,6 +163,10 @@ def nb_compute_residual_impl(
     iunpack = factories.iunpack_factory(corr_mode)
     valloc = factories.valloc_factory(corr_mode)
 
+    # With BDA, many effective rows map onto the same residual row. Only
+    # parallelise over rows when they cannot collide.
+    row_range = prange if isinstance(row_map, types.NoneType) else range
+
     def impl(
         data,
         model,
@@ -186,7 +192,7 @@ def nb_compute_residual_impl(
         else:
             dir_loop = np.array(sub_dirs)
 
-        for row_ind in prange(n_rows):
+        for row_ind in row_range(n_rows):
 
             row = get_row(row_ind, row_map)
             a1_m, a2_m = a1[row], a2[row]
@@ -82,7 +82,7 @@ class ParameterizedGain(Gain):
             scan_col,
             time_interval,
             respect_scan_boundaries,
-            dtype=np.int64,
+            dtype=np.int32,
             chunks=chunks
         )
 
@@ -106,20 +106,20 @@ class ParameterizedGain(Gain):
         )
 
     @classmethod
-    def make_param_time_map(cls, time_col, param_time_bins):
+    def make_param_time_map(cls, utime_inv, param_time_bins):
 
         param_time_map = da.map_blocks(
             cls._make_param_time_map,
-            time_col,
+            utime_inv,
             param_time_bins,
-            dtype=np.int64
+            dtype=np.int32
         )
 
         return param_time_map
 
     @classmethod
-    def _make_param_time_map(cls, time_col, param_time_bins):
-        return super()._make_time_map(time_col, param_time_bins)
+    def _make_param_time_map(cls, utime_inv, param_time_bins):
+        return super()._make_time_map(utime_inv, param_time_bins)
 
     @classmethod
     def make_param_time_chunks(cls, param_time_bins):
@@ -145,7 +145,7 @@ class ParameterizedGain(Gain):
             chan_freqs,
             chan_widths,
             freq_interval,
-            dtype=np.int64
+            dtype=np.int32
         )
 
         return param_freq_map
@@ -56,3 +56,37 @@ def mean_for_index(arr, inds):
         counts[ind] += 1
 
     return sums/counts
+
+
+@njit(**JIT_OPTIONS)
+def unique_sorted(arr):
+    """Equivalent to np.unique with indices and counts for sorted 1D input.
+
+    Avoids the sort performed by np.unique, exploiting the fact that columns
+    such as TIME are already ordered. Requires a single pass over the input.
+
+    Args:
+        arr: A sorted 1D numpy.ndarray.
+
+    Returns:
+        values: The unique values in arr.
+        indices: The index of the first occurrence of each unique value.
+        counts: The number of occurrences of each unique value.
+    """
+
+    n_elem = arr.size
+
+    values = np.empty(n_elem, dtype=arr.dtype)
+    indices = np.empty(n_elem, dtype=np.int64)
+    counts = np.zeros(n_elem, dtype=np.int64)
+
+    n_unique = 0
+
+    for i in range(n_elem):
+        if n_unique == 0 or arr[i] != values[n_unique - 1]:
+            values[n_unique] = arr[i]
+            indices[n_unique] = i
+            n_unique += 1
+        counts[n_unique - 1] += 1
+
+    return values[:n_unique], indices[:n_unique], counts[:n_unique]
@@ -0,0 +1,26 @@
+import pytest
+import numpy as np
+from quartical.apps.summary import _count_flags
+
+
+# --------------------------------_count_flags---------------------------------
+
+@pytest.mark.data_handling
+@pytest.mark.parametrize("shape", [(0, 16, 4), (60, 16, 1), (60, 16, 4)])
+@pytest.mark.parametrize("flag_row_frac", [0, 0.2, 1])
+def test_count_flags(shape, flag_row_frac):
+    """Check the per-block count against the broadcast FLAG | FLAG_ROW sum."""
+
+    rng = np.random.default_rng(shape[-1])
+
+    flag_col = rng.random(shape) < 0.3
+    flag_row_col = rng.random(shape[0]) < flag_row_frac
+
+    expected = np.sum(flag_col | flag_row_col[:, None, None])
+
+    n_flag = _count_flags(flag_col, flag_row_col)
+
+    assert n_flag.shape == (1, 1)
+    assert n_flag[0, 0] == expected
+
+# -----------------------------------------------------------------------------
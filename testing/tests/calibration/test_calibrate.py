@@ -1,6 +1,10 @@
 import pytest
 import numpy as np
+import dask.array as da
+import xarray
 from copy import deepcopy
+from numpy.testing import assert_array_equal
+from quartical.calibration.calibrate import make_visibility_output
 
 
 @pytest.fixture(scope="module")
@@ -190,4 +194,107 @@ def test_has_gain_field(gain_xds_lod):
                 for term_xds_dict in gain_xds_lod
                 for term_xds in term_xds_dict.values()])
 
+# ---------------------------make_visibility_output----------------------------
+
+
+@pytest.fixture(scope="module")
+def visibility_output_inputs():
+    """Synthetic data, gains and mappings spanning two row chunks."""
+
+    rng = np.random.default_rng(0)
+
+    n_time, n_ant, n_chan, n_dir, n_corr = 4, 5, 6, 2, 4
+
+    a1, a2 = np.triu_indices(n_ant, 1)
+    n_bl = a1.size
+    n_row = n_time * n_bl
+    row_chunks = (n_row // 2, n_row // 2)
+
+    def crandn(*shape):
+        return rng.normal(size=shape) + 1j * rng.normal(size=shape)
+
+    data_xds = xarray.Dataset(
+        {
+            "DATA": (("row", "chan", "corr"),
+                     da.from_array(crandn(n_row, n_chan, n_corr),
+                                   chunks=(row_chunks, -1, -1))),
+            "MODEL_DATA": (("row", "chan", "dir", "corr"),
+                           da.from_array(
+                               crandn(n_row, n_chan, n_dir, n_corr),
+                               chunks=(row_chunks, -1, -1, -1))),
+            "_WEIGHT": (("row", "chan", "corr"),
+                        da.ones((n_row, n_chan, n_corr),
+                                chunks=(row_chunks, -1, -1))),
+            "ANTENNA1": (("row",), da.from_array(np.tile(a1, n_time),
+                                                 chunks=(row_chunks,))),
+            "ANTENNA2": (("row",), da.from_array(np.tile(a2, n_time),
+                                                 chunks=(row_chunks,))),
+        }
+    )
+
+    # Each row chunk holds two unique times, each with its own gain.
+    gains = da.from_array(
+        crandn(n_time, n_chan, n_ant, n_dir, n_corr),
+        chunks=(2, -1, -1, -1, -1)
+    )
+    time_map = np.tile(np.repeat(np.arange(2), n_bl), 2).astype(np.int32)
+
+    gain_xds = xarray.Dataset(
+        {
+            "gains": (("gain_time", "gain_freq", "antenna", "direction",
+                       "correlation"), gains)
+        }
+    )
+
+    mapping_xds = xarray.Dataset(
+        {
+            "G_time_map": (("row",), da.from_array(time_map,
+                                                   chunks=(row_chunks,))),
+            "G_freq_map": (("chan",), da.arange(n_chan, dtype=np.int32)),
+            "G_dir_map": (("dir",), da.arange(n_dir, dtype=np.int32)),
+        }
+    )
+
+    return [data_xds], [{"G": gain_xds}], [mapping_xds]
+
+
+@pytest.mark.calibrate
+def test_fused_residuals(visibility_output_inputs, base_opts):
+    """Check the fused residual outputs against the separate layers."""
+
+    solver_opts = deepcopy(base_opts.solver)
+    solver_opts.threads = 1
+
+    unfused_opts = deepcopy(base_opts.output)
+    unfused_opts.products = ["residual"]
+    unfused_opts.subtract_directions = None
+
+    fused_opts = deepcopy(unfused_opts)
+    fused_opts.products = ["residual", "corrected_residual"]
+
+    unfused_xds, = make_visibility_output(
+        *visibility_output_inputs, solver_opts, unfused_opts
+    )
+    fused_xds, = make_visibility_output(
+        *visibility_output_inputs, solver_opts, fused_opts
+    )
+
+    # Only the request for both products should produce the fused layer.
+    def is_fused(xds):
+        layers = xds._CORRECTED_RESIDUAL.data.dask.layers
+        return any(k.startswith("dask_both_residuals") for k in layers)
+
+    assert is_fused(fused_xds)
+    assert not is_fused(unfused_xds)
+
+    outputs = ("_RESIDUAL", "_CORRECTED_RESIDUAL")
+
+    fused_outputs = da.compute(*[fused_xds[k].data for k in outputs])
+    unfused_outputs = da.compute(*[unfused_xds[k].data for k in outputs])
+
+    for fused, unfused in zip(fused_outputs, unfused_outputs):
+        assert fused.dtype == unfused.dtype
+        assert fused.shape == unfused.shape
+        assert_array_equal(fused, unfused)
+
 # -----------------------------------------------------------------------------
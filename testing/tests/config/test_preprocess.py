@@ -1,7 +1,10 @@
 import pytest
-from quartical.config.preprocess import transcribe_recipe, sky_model_nt
-import dask.array as da
+from quartical.config.preprocess import (transcribe_recipe,
+                                         split_recipe,
+                                         sky_model_nt)
+import operator
 import os.path
+import re
 
 
 # A dictionary mapping valid recipe inputs to expected outputs.
@@ -10,11 +13,11 @@ valid_recipes = {
     "COL1":
         {0: ["COL1"]},
     "~COL1":
-        {0: ['', da.subtract, 'COL1']},
+        {0: ['', operator.sub, 'COL1']},
     "MODEL.lsm.html":
         {0: [sky_model_nt('MODEL.lsm.html', ())]},
     "~MODEL.lsm.html":
-        {0: ['', da.subtract, sky_model_nt('MODEL.lsm.html', ())]},
+        {0: ['', operator.sub, sky_model_nt('MODEL.lsm.html', ())]},
     "MODEL.lsm.html@dE":
         {0: [sky_model_nt('MODEL.lsm.html', ('dE',))]},
     "MODEL.lsm.html@dE,dG":
@@ -32,18 +35,18 @@ valid_recipes = {
         {0: [sky_model_nt('MODEL.lsm.html', ())],
          1: [sky_model_nt('MODEL.lsm.html', ('dE',))]},
     "COL1~COL2":
-        {0: ['COL1', da.subtract, 'COL2']},
+        {0: ['COL1', operator.sub, 'COL2']},
     "COL1+COL2":
-        {0: ['COL1', da.add, 'COL2']},
+        {0: ['COL1', operator.add, 'COL2']},
     "COL1~MODEL.lsm.html":
-        {0: ['COL1', da.subtract, sky_model_nt('MODEL.lsm.html', ())]},
+        {0: ['COL1', operator.sub, sky_model_nt('MODEL.lsm.html', ())]},
     "COL1+MODEL.lsm.html":
-        {0: ['COL1', da.add, sky_model_nt('MODEL.lsm.html', ())]},
+        {0: ['COL1', operator.add, sky_model_nt('MODEL.lsm.html', ())]},
     "COL1~MODEL.lsm.html:COL2":
-        {0: ['COL1', da.subtract, sky_model_nt('MODEL.lsm.html', ())],
+        {0: ['COL1', operator.sub, sky_model_nt('MODEL.lsm.html', ())],
          1: ['COL2']},
     "COL1+MODEL.lsm.html:COL2":
-        {0: ['COL1', da.add, sky_model_nt('MODEL.lsm.html', ())],
+        {0: ['COL1', operator.add, sky_model_nt('MODEL.lsm.html', ())],
          1: ['COL2']}
 }
 
@@ -88,3 +91,17 @@ def test_transcribe_recipe_invalid(invalid_recipe):
 
     with pytest.raises(expected_output):
         transcribe_recipe(input_recipe)
+
+
+@pytest.mark.preprocess
+@pytest.mark.parametrize(
+    "input_recipe",
+    ["", "COL1", "~COL1", "COL1~COL2+COL3", "COL1++COL2", "COL1~"]
+)
+def test_split_recipe(input_recipe):
+
+    # split_recipe should reproduce the behaviour of re.split exactly.
+
+    expected_output = re.split(r'([\+~])', input_recipe)
+
+    assert split_recipe(input_recipe) == expected_output
@@ -0,0 +1,122 @@
+import pytest
+import numpy as np
+import dask.array as da
+import xarray
+from quartical.data_handling.chunking import chan_chunking, row_chunking
+
+
+def expected_bandwidth_chunks(chan_widths, freq_chunk):
+    """Accumulate channels until their total width exceeds freq_chunk."""
+
+    chunks = []
+    bin_width = 0
+    bin_nchan = 0
+    for width in chan_widths:
+        bin_width += width
+        bin_nchan += 1
+        if bin_width > freq_chunk:
+            chunks.append(bin_nchan)
+            bin_width = 0
+            bin_nchan = 0
+    if bin_width:
+        chunks.append(bin_nchan)
+
+    return tuple(chunks)
+
+
+@pytest.fixture(scope="module", params=[1, 7, 64, 250])
+def spw_xds_list(request):
+
+    n_chan = request.param
+
+    rng = np.random.default_rng(n_chan)
+
+    chan_widths = rng.uniform(0.5e6, 2e6, size=(1, n_chan))
+
+    xds = xarray.Dataset(
+        {"CHAN_WIDTH": (("row", "chan"), da.from_array(chan_widths))}
+    )
+
+    return [xds, xds.isel(chan=slice(None, None, -1))]
+
+# --------------------------------chan_chunking--------------------------------
+
+
+@pytest.mark.data_handling
+@pytest.mark.parametrize("freq_chunk", [1e5, 3.3e6, 2.5e7, 1e12])
+def test_chan_chunking_bandwidth(spw_xds_list, freq_chunk):
+    """Check bandwidth chunking of each SPW against the expected bins."""
+
+    chan_chunking_per_spw = chan_chunking(spw_xds_list, freq_chunk)
+
+    for ddid, xds in enumerate(spw_xds_list):
+        chan_widths = xds.CHAN_WIDTH.values[0]
+        assert chan_chunking_per_spw[ddid] == \
+            expected_bandwidth_chunks(chan_widths, freq_chunk)
+
+
+@pytest.mark.data_handling
+@pytest.mark.parametrize("freq_chunk", [0, 1, 5, 64, 1000])
+def test_chan_chunking_integer(spw_xds_list, freq_chunk):
+    """Check integer chunking, including a final partial chunk."""
+
+    chan_chunking_per_spw = chan_chunking(spw_xds_list, freq_chunk)
+
+    for ddid, xds in enumerate(spw_xds_list):
+        n_chan = xds.sizes["chan"]
+        n_full, remainder = divmod(n_chan, freq_chunk or n_chan)
+        expected = (freq_chunk or n_chan,) * n_full + \
+            ((remainder,) if remainder else ())
+        assert chan_chunking_per_spw[ddid] == expected
+
+# --------------------------------row_chunking---------------------------------
+
+
+@pytest.fixture(scope="module", params=[1, 13, 200])
+def indexing_xds(request):
+
+    n_utime = request.param
+
+    rng = np.random.default_rng(n_utime)
+
+    intervals = rng.choice([2.0, 4.0, 8.0], size=n_utime)
+    utimes = np.cumsum(intervals)
+    rows_per_time = rng.integers(1, 10, size=n_utime)
+
+    time_col = np.repeat(utimes, rows_per_time)
+    interval_col = np.repeat(intervals, rows_per_time)
+
+    return xarray.Dataset(
+        {
+            "TIME": (("row",), da.from_array(time_col)),
+            "INTERVAL": (("row",), da.from_array(interval_col))
+        }
+    )
+
+
+@pytest.mark.data_handling
+@pytest.mark.parametrize("time_chunk", [1.0, 8.0, 30.0, 1e9])
+def test_row_chunking_interval(indexing_xds, time_chunk):
+    """Check interval chunking against binning the cumulative interval."""
+
+    time_col = indexing_xds.TIME.values
+    interval_col = indexing_xds.INTERVAL.values
+
+    _, uinds, ucounts = np.unique(
+        time_col, return_index=True, return_counts=True
+    )
+    cumulative_interval = np.cumsum(interval_col[uinds])
+    cumulative_interval -= cumulative_interval[0]
+    chunk_map = cumulative_interval // time_chunk
+
+    _, chunk_inds, expected_utime = np.unique(
+        chunk_map, return_index=True, return_counts=True
+    )
+    expected_row = np.add.reduceat(ucounts, chunk_inds)
+
+    utime_chunks, row_chunks = row_chunking([indexing_xds], time_chunk)
+
+    assert utime_chunks[0] == tuple(expected_utime)
+    assert row_chunks[0] == tuple(expected_row)
+
+# -----------------------------------------------------------------------------
@@ -1,7 +1,10 @@
 from copy import deepcopy
 import pytest
-from quartical.data_handling.ms_handler import write_xds_list
+from quartical.data_handling.ms_handler import (write_xds_list,
+                                               _zero_nonfinite)
 import numpy as np
+import dask.array as da
+from numpy.testing import assert_array_equal
 
 
 @pytest.fixture(scope="module")
@@ -86,4 +89,33 @@ def test_write_columns_present(written_xds_list):
     # Check that the column to be written is on the writable_xds.
     assert np.all([hasattr(xds, "TEST_RESIDUALS") for xds in written_xds_list])
 
+# -------------------------------_zero_nonfinite-------------------------------
+
+@pytest.mark.data_handling
+@pytest.mark.parametrize("dtype", [np.complex64, np.complex128])
+def test_zero_nonfinite(dtype):
+    """Check the jitted kernel against the da.where it replaced."""
+
+    rng = np.random.default_rng(0)
+
+    shape = (50, 16, 4)
+    data = (rng.normal(size=shape) + 1j*rng.normal(size=shape)).astype(dtype)
+
+    bad = rng.random(shape) < 0.1
+    data[bad] = rng.choice(
+        [np.nan, np.inf, -np.inf, complex(1, np.nan), complex(np.inf, 1)],
+        size=bad.sum()
+    )
+
+    data_col = da.from_array(data, chunks=(20, 8, -1))
+
+    expected = da.where(da.isfinite(data_col), data_col, 0)
+    result = data_col.map_blocks(_zero_nonfinite, dtype=data_col.dtype)
+
+    expected, result = da.compute(expected, result)
+
+    assert result.dtype == data.dtype
+    assert np.all(np.isfinite(result))
+    assert_array_equal(result, expected)
+
 # -----------------------------------------------------------------------------
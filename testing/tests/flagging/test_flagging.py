@@ -0,0 +1,96 @@
+import pytest
+import numpy as np
+import dask.array as da
+from numpy.testing import assert_array_equal
+from quartical.flagging.flagging import initialise_flags
+
+
+n_row, n_chan = 10, 3
+
+
+def make_columns(n_corr):
+    """Clean columns - unit data and weights with nothing flagged."""
+
+    shape = (n_row, n_chan, n_corr)
+
+    data_col = np.ones(shape, dtype=np.complex64)
+    weight_col = np.ones(shape, dtype=np.float32)
+    flag_col = np.zeros(shape, dtype=bool)
+    flag_row_col = np.zeros(n_row, dtype=bool)
+
+    return data_col, weight_col, flag_col, flag_row_col
+
+
+def run_initialise_flags(data_col, weight_col, flag_col, flag_row_col):
+
+    return initialise_flags(
+        da.from_array(data_col, chunks=(4, -1, -1)),
+        da.from_array(weight_col, chunks=(4, -1, -1)),
+        da.from_array(flag_col, chunks=(4, -1, -1)),
+        da.from_array(flag_row_col, chunks=4)
+    ).compute()
+
+# ------------------------------initialise_flags-------------------------------
+
+
+@pytest.mark.data_handling
+@pytest.mark.parametrize("n_corr", [1, 2, 4])
+def test_clean_data(n_corr):
+
+    flags = run_initialise_flags(*make_columns(n_corr))
+
+    assert flags.dtype == np.int8
+    assert flags.shape == (n_row, n_chan)
+    assert not flags.any()
+
+
+@pytest.mark.data_handling
+@pytest.mark.parametrize("n_corr", [1, 2, 4])
+def test_existing_flags(n_corr):
+
+    data_col, weight_col, flag_col, flag_row_col = make_columns(n_corr)
+
+    flag_col[1, 2, -1] = True  # A single correlation flags the point.
+    flag_row_col[[5, 9]] = True  # Straddles the row chunks.
+
+    expected = np.zeros((n_row, n_chan), dtype=np.int8)
+    expected[1, 2] = 1
+    expected[[5, 9]] = 1
+
+    flags = run_initialise_flags(data_col, weight_col, flag_col, flag_row_col)
+
+    assert_array_equal(flags, expected)
+
+
+@pytest.mark.data_handling
+@pytest.mark.parametrize("n_corr", [1, 2, 4])
+def test_invalid_diagonal(n_corr):
+
+    data_col, weight_col, flag_col, flag_row_col = make_columns(n_corr)
+
+    data_col[3, 0, 0] = 0  # Missing data.
+    weight_col[7, 1, -1] = 0  # Null weight.
+
+    expected = np.zeros((n_row, n_chan), dtype=np.int8)
+    expected[3, 0] = 1
+    expected[7, 1] = 1
+
+    flags = run_initialise_flags(data_col, weight_col, flag_col, flag_row_col)
+
+    assert_array_equal(flags, expected)
+
+
+@pytest.mark.data_handling
+def test_invalid_off_diagonal():
+    """Zero data/weights on the off-diagonal correlations are not flagged."""
+
+    data_col, weight_col, flag_col, flag_row_col = make_columns(4)
+
+    data_col[2, 1, 1] = 0
+    weight_col[6, 2, 2] = 0
+
+    flags = run_initialise_flags(data_col, weight_col, flag_col, flag_row_col)
+
+    assert not flags.any()
+
+# -----------------------------------------------------------------------------
@@ -0,0 +1,90 @@
+import pytest
+import numpy as np
+import scipy.fft
+from numpy.testing import assert_array_equal
+from quartical.gains.delay.kernel import estimate_delays
+
+
+n_ant = 6
+n_chan = 32
+n_time = 6
+delta_freq = 2e6
+chan_freq = 1.4e9 + delta_freq * np.arange(n_chan)
+
+# Both frequency intervals have n_chan // 2 channels so they share the grid
+# of the zero-padded transform.
+n_fft = int(np.ceil(2 ** 15 / (n_chan // 2))) * (n_chan // 2)
+delay_grid = scipy.fft.fftfreq(n_fft, delta_freq)
+
+
+@pytest.fixture(params=[(1, 0), (2, 3), (4, 5)], ids=lambda p: f"{p}")
+def corr_and_ref(request):
+    return request.param
+
+
+@pytest.fixture
+def delay_inputs(corr_and_ref):
+    """Noise-free data with known delays lying on the delay grid."""
+
+    n_corr, ref_ant = corr_and_ref
+    n_diag = 2 if n_corr > 1 else 1
+
+    rng = np.random.default_rng(n_ant * n_corr + ref_ant)
+
+    a1, a2 = np.triu_indices(n_ant)  # Include autos, which must be ignored.
+    n_bl = a1.size
+    a1 = np.tile(a1, n_time)
+    a2 = np.tile(a2, n_time)
+    t_map = np.repeat(np.arange(n_time) // 2, n_bl)
+    f_map = np.arange(n_chan) // (n_chan // 2)
+
+    # Delays per (time interval, freq interval, antenna, diag corr).
+    grid_ind = rng.integers(-400, 400, size=(n_time // 2, 2, n_ant, n_diag))
+    grid_ind[..., ref_ant, :] = 0
+    delays = delay_grid[grid_ind]
+
+    bl_delays = delays[t_map, :, a1] - delays[t_map, :, a2]
+    bl_delays = bl_delays[:, f_map]  # (row, chan, diag_corr)
+
+    data = np.zeros((a1.size, n_chan, n_corr), dtype=np.complex128)
+    data[..., (0, -1)[:n_diag]] = \
+        np.exp(2j * np.pi * bl_delays * chan_freq[None, :, None])
+    if n_corr == 4:
+        data[..., 1:3] = np.nan  # Off-diagonals are ignored.
+
+    flags = (rng.random((a1.size, n_chan)) < 0.1).astype(np.int8)
+
+    # Flag all data for one antenna in the first time interval.
+    bad_ant = (ref_ant + 1) % n_ant
+    flags[(t_map == 0) & ((a1 == bad_ant) | (a2 == bad_ant))] = 1
+    delays[0, :, bad_ant] = 0
+
+    args = (data, flags, a1, a2, chan_freq, t_map, f_map, ref_ant, n_ant)
+
+    return args, delays
+
+
+def test_estimate_delays(delay_inputs):
+    """Check that the delays are recovered relative to the ref_ant."""
+
+    args, expected = delay_inputs
+
+    t_ind, f_ind, a_ind, delay_est = estimate_delays(*args)
+
+    est = np.zeros_like(expected)
+    est[t_ind, f_ind, a_ind] = delay_est
+
+    assert_array_equal(est, expected)
+
+
+def test_estimate_delays_no_mutation(delay_inputs):
+    """Check that the input data is not modified by the flagging."""
+
+    args, _ = delay_inputs
+
+    data = args[0]
+    data_copy = data.copy()
+
+    estimate_delays(*args)
+
+    assert_array_equal(data, data_copy)
@@ -0,0 +1,40 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_array_equal
+from quartical.utils.maths import unique_sorted
+
+
+@pytest.fixture(scope="module")
+def sorted_data():
+
+    rng = np.random.default_rng(0)
+
+    return np.sort(rng.integers(0, 10, size=100)).astype(np.float64)
+
+
+# -------------------------------unique_sorted---------------------------------
+
+def test_unique_sorted(sorted_data):
+    """Check that unique_sorted is consistent with np.unique."""
+
+    np_values, np_indices, np_counts = np.unique(
+        sorted_data,
+        return_index=True,
+        return_counts=True
+    )
+
+    values, indices, counts = unique_sorted(sorted_data)
+
+    assert_array_equal(np_values, values)
+    assert_array_equal(np_indices, indices)
+    assert_array_equal(np_counts, counts)
+
+
+def test_unique_sorted_empty():
+    """Check that unique_sorted handles empty inputs."""
+
+    values, indices, counts = unique_sorted(np.empty(0, dtype=np.float64))
+
+    assert values.size == indices.size == counts.size == 0
+
+# -----------------------------------------------------------------------------